@@ -0,0 +1,154 @@
+import os
+import json
+from .parallelism_analysis import (
+    data_parallelism_multiprocessing,
+    data_parallelism_threading,
+    task_parallelism_multiprocessing,
+    task_parallelism_futures
+)
+
+OUTPUT_BASE = os.path.join(os.path.dirname(__file__), "../../output")
+
+def analyze_data_parallelism(images, counts=(1, 2, 4, 8), trace=False):
+    """Analyze performance for data parallelism using both multiprocessing and futures.
+
+    Speedup is measured against the 1-worker run, so counts must include 1.
+    """
+    counts = sorted(set(counts))
+    if counts[0] != 1:
+        raise ValueError(f"worker counts must include 1 as the speedup baseline, got {counts}")
+    print("\n=== Data Parallelism Analysis ===")
+    results_mp = []
+    results_futures = []
+    all_logs_mp = []
+    all_logs_futures = []
+    
+    # First, collect all timing data
+    times_mp = []
+    times_futures = []
+    logs_mp_by_count = {}
+    logs_futures_by_count = {}
+
+    for count in counts:
+        # Multiprocessing
+        output_dir_mp = os.path.join(OUTPUT_BASE, f"data_mp_{count}")
+        time_mp, logs_mp = data_parallelism_multiprocessing(images, output_dir_mp, count, trace=trace)
+        times_mp.append(time_mp)
+        logs_mp_by_count[count] = logs_mp
+        print(f"Data MP ({count} processes): {time_mp:.4f}s")
+
+    for count in counts:
+        # Multithreading
+        output_dir_futures = os.path.join(OUTPUT_BASE, f"data_mt_{count}")
+        time_futures, logs_futures = data_parallelism_threading(images, output_dir_futures, count, trace=trace)
+        times_futures.append(time_futures)
+        logs_futures_by_count[count] = logs_futures
+        print(f"Data MT ({count} threads): {time_futures:.4f}s")
+    
+    # Use 1-core time as baseline for speedup calculation
+    baseline_mp = times_mp[0]  # 1 core time
+    baseline_futures = times_futures[0]  # 1 core time
+    
+    print("\n=== Speedup Calculation (using 1-core as baseline) ===")
+    for i, count in enumerate(counts):
+        speedup_mp = baseline_mp / times_mp[i]
+        efficiency_mp = speedup_mp / count
+        results_mp.append((count, times_mp[i], speedup_mp, efficiency_mp))
+        all_logs_mp.extend(logs_mp_by_count[count])
+        print(f"Data MP ({count} processes): Speedup: {speedup_mp:.2f}, Efficiency: {efficiency_mp:.2f}")
+        
+        speedup_futures = baseline_futures / times_futures[i]
+        efficiency_futures = speedup_futures / count
+        results_futures.append((count, times_futures[i], speedup_futures, efficiency_futures))
+        all_logs_futures.extend(logs_futures_by_count[count])
+        print(f"Data MT ({count} threads): Speedup: {speedup_futures:.2f}, Efficiency: {efficiency_futures:.2f}")
+
+    return results_mp, results_futures, all_logs_mp, all_logs_futures
+    # return results_mp, all_logs_mp
+
+def analyze_task_parallelism(images, seq_time):
+    """Analyze performance for task parallelism using both multiprocessing and futures."""
+    print("\n=== Task Parallelism Analysis ===")
+    counts = [1, 2, 4, 8]
+    results_mp = []
+    results_futures = []
+
+    for count in counts:
+        # Multiprocessing
+        output_dir_mp = os.path.join(OUTPUT_BASE, f"task_mp_{count}")
+        time_mp = task_parallelism_multiprocessing(images, output_dir_mp, count)
+        speedup_mp = seq_time / time_mp
+        efficiency_mp = speedup_mp / count
+        results_mp.append((count, time_mp, speedup_mp, efficiency_mp))
+        print(f"Task MP ({count} processes): {time_mp:.4f}s, Speedup: {speedup_mp:.2f}, Efficiency: {efficiency_mp:.2f}")
+
+        # Futures
+        output_dir_futures = os.path.join(OUTPUT_BASE, f"task_futures_{count}")
+        time_futures = task_parallelism_futures(images, output_dir_futures, count)
+        speedup_futures = seq_time / time_futures
+        efficiency_futures = speedup_futures / count
+        results_futures.append((count, time_futures, speedup_futures, efficiency_futures))
+        print(f"Task Futures ({count} workers): {time_futures:.4f}s, Speedup: {speedup_futures:.2f}, Efficiency: {efficiency_futures:.2f}")
+
+    return results_mp, results_futures
+
+def print_detailed_comparison(data_mp, data_futures, task_mp=None, task_futures=None):
+# def print_detailed_comparison(data_mp, task_mp=None, task_futures=None):
+    """Print a detailed comparison table."""
+    print("\n=== Detailed Performance Comparison ===")
+    print("Type\t\tLibrary\t\tWorkers\tTime (s)\tSpeedup\tEfficiency")
+    print("-" * 80)
+
+    for count, t, s, e in data_mp:
+        print(f"Data\t\tMultiprocessing\t{count}\t{t:.4f}\t{s:.2f}\t{e:.2f}")
+    for count, t, s, e in data_futures:
+        print(f"Data\t\tFutures\t\t{count}\t{t:.4f}\t{s:.2f}\t{e:.2f}")
+    if task_mp and task_futures:
+        for count, t, s, e in task_mp:
+            print(f"Task\t\tMultiprocessing\t{count}\t{t:.4f}\t{s:.2f}\t{e:.2f}")
+        for count, t, s, e in task_futures:
+            print(f"Task\t\tFutures\t\t{count}\t{t:.4f}\t{s:.2f}\t{e:.2f}")
+
+def events_path(filename):
+    """Where save_benchmark puts the trace events that belong to a results file."""
+    return os.path.splitext(filename)[0] + "_events.jsonl"
+
+def save_benchmark(data_mp, data_futures, logs_mp=None, logs_futures=None, filename="benchmark_results.json"):
+    """Save raw benchmark results and logs to JSON so reports can be generated later.
+
+    Trace events are written separately, one compact JSON row per event
+    ([method, log_id, category, name, start, end]), so the report can stream
+    them instead of loading millions of events with the results.
+    """
+    logs = {'mp': logs_mp or [], 'futures': logs_futures or []}
+    results = {'data_mp': data_mp, 'data_futures': data_futures, 'events_file': None}
+    for method, method_logs in logs.items():
+        results[f'logs_{method}'] = [dict({k: v for k, v in log.items() if k != 'events'}, log_id=log_id)
+                                     for log_id, log in enumerate(method_logs)]
+
+    if any(log.get('events') for method_logs in logs.values() for log in method_logs):
+        results['events_file'] = events_path(filename)
+        with open(results['events_file'], 'w') as f:
+            for method, method_logs in logs.items():
+                for log_id, log in enumerate(method_logs):
+                    for event in log.get('events') or ():
+                        f.write(json.dumps([method, log_id, *event], separators=(',', ':')) + "\n")
+
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2, default=str)
+    print(f"\nBenchmark results saved to {filename}")
+    if results['events_file']:
+        print(f"Trace events saved to {results['events_file']}")
+
+def load_benchmark(filename="benchmark_results.json"):
+    """Load results written by save_benchmark (trace events stay on disk; see iter_events)."""
+    with open(filename) as f:
+        return json.load(f)
+
+def iter_events(events_file, method):
+    """Stream (log_id, category, name, start, end) for one method ('mp' or 'futures') from an events file."""
+    with open(events_file) as f:
+        for line in f:
+            row = json.loads(line)
+            if row[0] == method:
+                yield tuple(row[1:])
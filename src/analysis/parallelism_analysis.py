@@ -27,7 +27,7 @@ def get_core_id():
 #     tid = threading.get_ident() 
 #     return f"PID:{pid} | TID:{tid}"
 
-def chunk_data(data, num_chunks, output_dir):
+def chunk_data(data, num_chunks, output_dir, trace=False):
     """Split data into approximately equal chunks."""
     chunk_size = len(data) // num_chunks
     remainder = len(data) % num_chunks
@@ -35,17 +35,18 @@ def chunk_data(data, num_chunks, output_dir):
     start = 0
     for i in range(num_chunks):
         end = start + chunk_size + (1 if i < remainder else 0)
-        chunks.append((data[start:end], i, output_dir))  # Include chunk_id and output_dir
+        chunks.append((data[start:end], i, output_dir, trace))  # Include chunk_id, output_dir and trace flag
         start = end
     return chunks
 
-def process_chunk(chunk, chunk_id, output_dir):
-    """Process a chunk of images and return logging info."""
+def process_chunk(chunk, chunk_id, output_dir, trace=False):
+    """Process a chunk of images and return logging info (plus per-image/stage events if trace)."""
+    events = [] if trace else None
     start_time = time.time()
     
     # Process images
     for img_path in chunk:
-        process_image(img_path, output_dir)
+        process_image(img_path, output_dir, events)
     
     end_time = time.time()
     # core_id = os.getpid()
@@ -54,7 +55,7 @@ def process_chunk(chunk, chunk_id, output_dir):
     pid = os.getpid() 
     tid = threading.get_ident() 
 
-    return {
+    log = {
         'chunk_id': chunk_id,
         'core_id': core_id,
         # 'thread_info': thread_info,
@@ -64,10 +65,13 @@ def process_chunk(chunk, chunk_id, output_dir):
         'start_time': start_time,
         'end_time': end_time
     }
+    if trace:
+        log['events'] = events
+    return log
 
-def data_parallelism_multiprocessing(images, output_dir, num_processes):
+def data_parallelism_multiprocessing(images, output_dir, num_processes, verbose=True, trace=False):
     """Data parallelism using multiprocessing Pool with starmap."""
-    chunks = chunk_data(images, num_processes, output_dir)
+    chunks = chunk_data(images, num_processes, output_dir, trace)
     start_time = time.time()
 
     with Pool(processes=num_processes) as pool:
@@ -81,6 +85,8 @@ def data_parallelism_multiprocessing(images, output_dir, num_processes):
         res['total_process'] = num_processes  # Add total process count to each log
         logs.append(res)
         
+        if not verbose:
+            continue
         # Print log
         print(f"[Process] Data Chunk ID: {res['chunk_id']} ---> CPU Core ID: {res['core_id']}")
         # print(f"Identity Info: {res['thread_info']}")
@@ -89,9 +95,9 @@ def data_parallelism_multiprocessing(images, output_dir, num_processes):
     
     return total_duration, logs
 
-def data_parallelism_threading(images, output_dir, num_workers):
+def data_parallelism_threading(images, output_dir, num_workers, verbose=True, trace=False):
     """Data parallelism using futures by manually chunking data."""
-    chunks = chunk_data(images, num_workers, output_dir)
+    chunks = chunk_data(images, num_workers, output_dir, trace)
     start_time = time.time()
     
     # with ThreadPoolExecutor(max_workers=num_workers) as executor:
@@ -101,8 +107,8 @@ def data_parallelism_threading(images, output_dir, num_workers):
     with ThreadPoolExecutor(max_workers=num_workers) as executor:
         # submit accepts arguments as separate items, so unpack the tuple
         futures = [
-            executor.submit(process_chunk, chunk, chunk_id, output_dir)
-            for chunk, chunk_id, output_dir in chunks
+            executor.submit(process_chunk, *chunk)
+            for chunk in chunks
         ]
 
         logs = []
@@ -113,6 +119,8 @@ def data_parallelism_threading(images, output_dir, num_workers):
             res['total_workers'] = num_workers  # Add total worker count to each log
             logs.append(res)
         
+            if not verbose:
+                continue
             # Print log
             print(f"[Thread] Data Chunk ID: {res['chunk_id']} ---> CPU Core ID: {res['core_id']}")
             # print(f"Identity Info: {res['thread_info']}")
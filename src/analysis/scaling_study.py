@@ -0,0 +1,255 @@
+import os
+import sys
+import json
+import math
+import time
+import platform
+import statistics
+from utils import process_image
+from .parallelism_analysis import (
+    data_parallelism_multiprocessing,
+    data_parallelism_threading,
+    task_parallelism_multiprocessing,
+    task_parallelism_futures
+)
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+OUTPUT_BASE = os.path.join(os.path.dirname(__file__), "../../output")
+
+DEFAULT_COUNTS = [1, 2, 4, 8]
+
+# Two-sided 95% Student t critical values by degrees of freedom (normal approximation above 30)
+T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+    9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131,
+    16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080, 22: 2.074,
+    23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042
+}
+
+# OpenCV build-information sections that affect filter throughput
+CV2_BUILD_KEYS = ('Baseline', 'Dispatched code', 'Parallel framework', 'Intel IPP', 'Lapack', 'Other third-party libraries')
+
+
+def _run_sequential(images, output_dir, count=1):
+    """In-process baseline: no pool start-up, no chunking, one image after another."""
+    start_time = time.time()
+    for img_path in images:
+        process_image(img_path, output_dir)
+    return time.time() - start_time
+
+def _run_data_mp(images, output_dir, count):
+    return data_parallelism_multiprocessing(images, output_dir, count, verbose=False)[0]
+
+def _run_data_mt(images, output_dir, count):
+    return data_parallelism_threading(images, output_dir, count, verbose=False)[0]
+
+BACKENDS = {
+    'mp': ("Data MP", _run_data_mp),
+    'mt': ("Data MT", _run_data_mt),
+    'task_mp': ("Task MP", task_parallelism_multiprocessing),
+    'task_futures': ("Task Futures", task_parallelism_futures),
+}
+
+
+def machine_fingerprint():
+    """Describe the host so results from different machines are not compared blindly."""
+    import cv2
+    import numpy as np
+
+    cpu_model = platform.processor() or "unknown"
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    cpu_model = line.split(':', 1)[1].strip()
+                    break
+    except OSError:
+        pass
+
+    usable_cores = os.cpu_count()
+    if hasattr(os, 'sched_getaffinity'):
+        usable_cores = len(os.sched_getaffinity(0))
+
+    build_flags = {}
+    for line in cv2.getBuildInformation().splitlines():
+        key, sep, value = line.strip().partition(':')
+        if sep and key.strip() in CV2_BUILD_KEYS:
+            build_flags[key.strip()] = value.strip()
+
+    return {
+        'cpu_model': cpu_model,
+        'logical_cores': os.cpu_count(),
+        'physical_cores': psutil.cpu_count(logical=False) if HAS_PSUTIL else None,
+        'usable_cores': usable_cores,
+        'platform': platform.platform(),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'opencv': cv2.__version__,
+        'opencv_threads': cv2.getNumThreads(),
+        'opencv_optimized': cv2.useOptimized(),
+        'opencv_build': build_flags,
+    }
+
+
+def summarize(samples):
+    """Mean, spread and 95% confidence interval of repeated measurements."""
+    n = len(samples)
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if n > 1 else 0.0
+    half_width = T_CRITICAL_95.get(n - 1, 1.96) * stdev / math.sqrt(n) if n > 1 else 0.0
+    return {
+        'n': n,
+        'mean': mean,
+        'median': statistics.median(samples),
+        'min': min(samples),
+        'stdev': stdev,
+        'ci95_low': mean - half_width,
+        'ci95_high': mean + half_width,
+    }
+
+
+def summarize_speedup(baseline_times, parallel_times, scale=1.0):
+    """Speedup scale * mean(baseline) / mean(parallel) with a 95% CI from both samples' variance.
+
+    The interval uses the delta method for a ratio of means, with the t value
+    of the smaller sample so the interval is not narrower than either input supports.
+    """
+    base, par = summarize(baseline_times), summarize(parallel_times)
+    speedup = scale * base['mean'] / par['mean']
+    rel_var = (base['stdev'] / base['mean']) ** 2 / base['n'] + (par['stdev'] / par['mean']) ** 2 / par['n']
+    stderr = speedup * math.sqrt(rel_var)
+    df = min(base['n'], par['n']) - 1
+    half_width = T_CRITICAL_95.get(df, 1.96) * stderr if df > 0 else 0.0
+    return {
+        'mean': speedup,
+        'stderr': stderr,
+        'ci95_low': speedup - half_width,
+        'ci95_high': speedup + half_width,
+    }
+
+
+def fit_amdahl(counts, speedups):
+    """Least-squares serial fraction s for strong scaling: S(p) = 1 / (s + (1 - s) / p)."""
+    # Linearised: 1/S - 1/p = s * (1 - 1/p)
+    points = [(1 - 1 / p, 1 / s - 1 / p) for p, s in zip(counts, speedups) if p > 1 and s > 0]
+    denom = sum(x * x for x, _ in points)
+    if not denom:
+        return None
+    serial = min(max(sum(x * y for x, y in points) / denom, 0.0), 1.0)
+    return {
+        'serial_fraction': serial,
+        # None rather than infinity when no serial part was measured, to keep the JSON strict
+        'max_speedup': 1 / serial if serial > 0 else None,
+        'predicted': [1 / (serial + (1 - serial) / p) for p in counts],
+    }
+
+
+def fit_gustafson(counts, scaled_speedups):
+    """Least-squares serial fraction s for weak scaling: S(p) = p - s * (p - 1)."""
+    points = [(p - 1, p - s) for p, s in zip(counts, scaled_speedups) if p > 1]
+    denom = sum(x * x for x, _ in points)
+    if not denom:
+        return None
+    serial = min(max(sum(x * y for x, y in points) / denom, 0.0), 1.0)
+    return {
+        'serial_fraction': serial,
+        'predicted': [p - serial * (p - 1) for p in counts],
+    }
+
+
+def _workload(images, size):
+    """Repeat the input list cyclically until it holds `size` entries."""
+    repeats = -(-size // len(images))
+    return (images * repeats)[:size]
+
+
+def _time_trials(run, images, output_dir, count, trials, warmup):
+    for _ in range(warmup):
+        run(images, output_dir, count)
+    return [run(images, output_dir, count) for _ in range(trials)]
+
+
+def run_scaling_study(images, counts=None, backends=('mp', 'mt'), trials=5, warmup=1,
+                      null_sink=True, weak_per_worker=None):
+    """Repeated strong- (and optionally weak-) scaling runs with CIs and Amdahl/Gustafson fits.
+
+    Strong scaling keeps the full image list fixed while the worker count grows.
+    Weak scaling gives every worker `weak_per_worker` images, so the total grows with p.
+    With null_sink the filtered images are discarded, so the timings exclude disk writes.
+    Speedups are relative to an in-process sequential baseline timed with the same
+    warm-up, trials and sink (for weak scaling, on one worker's share of images),
+    so pool start-up cost counts against the parallel runs rather than the baseline.
+    """
+    counts = sorted(counts or DEFAULT_COUNTS)
+    if trials < 1 or warmup < 0 or counts[0] < 1:
+        raise ValueError(f"need trials >= 1, warmup >= 0 and worker counts >= 1 (got {trials}, {warmup}, {counts})")
+    experiments = [('strong', lambda p: images)]
+    if weak_per_worker:
+        experiments.append(('weak', lambda p: _workload(images, weak_per_worker * p)))
+
+    study = {
+        'machine': machine_fingerprint(),
+        'config': {
+            'counts': counts,
+            'backends': list(backends),
+            'trials': trials,
+            'warmup': warmup,
+            'null_sink': null_sink,
+            'weak_per_worker': weak_per_worker,
+            'num_images': len(images),
+            'baseline': 'sequential',
+        },
+        'baseline': {},
+        'results': {},
+    }
+
+    for mode, workload in experiments:
+        print(f"\n=== {mode.capitalize()} Scaling Study ({trials} trials, {warmup} warm-up) ===")
+        output_dir = None if null_sink else os.path.join(OUTPUT_BASE, f"study_{mode}_sequential")
+        base_times = _time_trials(_run_sequential, workload(1), output_dir, 1, trials, warmup)
+        base = summarize(base_times)
+        study['baseline'][mode] = {'times': base_times, 'time': base}
+        print(f"Sequential baseline: {base['mean']:.4f}s [95% CI {base['ci95_low']:.4f}-{base['ci95_high']:.4f}]")
+
+        for backend in backends:
+            label, run = BACKENDS[backend]
+            rows = []
+            for count in counts:
+                output_dir = None if null_sink else os.path.join(OUTPUT_BASE, f"study_{mode}_{backend}_{count}")
+                times = _time_trials(run, workload(count), output_dir, count, trials, warmup)
+                rows.append({'workers': count, 'times': times, 'time': summarize(times)})
+
+            for row in rows:
+                p = row['workers']
+                # Weak scaling reports scaled speedup: p times the baseline's work in the baseline's time
+                factor = p if mode == 'weak' else 1
+                row['speedup'] = summarize_speedup(base_times, row['times'], factor)
+                row['efficiency'] = row['speedup']['mean'] / p
+                t, s = row['time'], row['speedup']
+                print(f"{label} ({p} workers): {t['mean']:.4f}s "
+                      f"[95% CI {t['ci95_low']:.4f}-{t['ci95_high']:.4f}], "
+                      f"Speedup: {s['mean']:.2f} [{s['ci95_low']:.2f}-{s['ci95_high']:.2f}], "
+                      f"Efficiency: {row['efficiency']:.2f}")
+
+            worker_counts = [row['workers'] for row in rows]
+            speedups = [row['speedup']['mean'] for row in rows]
+            fit = fit_gustafson(worker_counts, speedups) if mode == 'weak' else fit_amdahl(worker_counts, speedups)
+            if fit:
+                law = "Gustafson" if mode == 'weak' else "Amdahl"
+                print(f"{label} {law} fit: serial fraction {fit['serial_fraction']:.3f}")
+
+            study['results'].setdefault(mode, {})[backend] = {'runs': rows, 'fit': fit}
+
+    return study
+
+
+def save_study(study, filename="scaling_study.json"):
+    """Write the scaling study, including the machine fingerprint, to JSON."""
+    with open(filename, 'w') as f:
+        json.dump(study, f, indent=2, default=str)
+    print(f"\nScaling study saved to {filename}")
@@ -0,0 +1,70 @@
+import os
+import sys
+import json
+import time
+import statistics
+import subprocess
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+MAIN_SCRIPT = os.path.join(SRC_DIR, "performance_analysis.py")
+
+# Libraries only the report step needs; a worker process must never load them
+HEAVY_MODULES = ('pandas', 'matplotlib', 'tqdm', 'openpyxl')
+
+# Mirrors what a spawned worker does: re-run the main script as __mp_main__,
+# then import the module that holds the pickled worker functions.
+WORKER_BOOT = f"""
+import sys, time, json, runpy
+start = time.perf_counter()
+sys.path.insert(0, {SRC_DIR!r})
+runpy.run_path({MAIN_SCRIPT!r}, run_name='__mp_main__')
+import analysis.parallelism_analysis
+elapsed = time.perf_counter() - start
+print(json.dumps({{'import_time': elapsed, 'heavy_modules': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+def measure_worker_startup(trials=5):
+    """Time fresh interpreters booting like a spawned worker and list any heavy modules they load."""
+    wall_times = []
+    import_times = []
+    heavy_modules = set()
+    for _ in range(trials):
+        start = time.perf_counter()
+        try:
+            out = subprocess.run([sys.executable, "-c", WORKER_BOOT], capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            # Surface the child's own traceback (e.g. a broken import), not just the exit status
+            raise RuntimeError(f"worker startup failed with exit code {e.returncode}:\n{e.stderr}") from e
+        wall_times.append(time.perf_counter() - start)
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        import_times.append(result['import_time'])
+        heavy_modules.update(result['heavy_modules'])
+    return {
+        'trials': trials,
+        'wall_median': statistics.median(wall_times),
+        'wall_max': max(wall_times),
+        'import_median': statistics.median(import_times),
+        'heavy_modules': sorted(heavy_modules),
+    }
+
+def check_worker_startup(budget=1.0, trials=5):
+    """Fail if worker startup exceeds `budget` seconds (median), loads reporting libraries or crashes."""
+    print("\n=== Worker Startup Benchmark ===")
+    try:
+        result = measure_worker_startup(trials)
+    except RuntimeError as e:
+        print(f"FAIL: {e}")
+        return False, None
+    print(f"Interpreter + imports: {result['wall_median']:.3f}s median, {result['wall_max']:.3f}s max ({trials} runs)")
+    print(f"Imports only: {result['import_median']:.3f}s median")
+
+    ok = True
+    if result['heavy_modules']:
+        print(f"FAIL: worker imports reporting libraries: {', '.join(result['heavy_modules'])}")
+        ok = False
+    if result['wall_median'] > budget:
+        print(f"FAIL: startup {result['wall_median']:.3f}s exceeds budget of {budget:.3f}s")
+        ok = False
+    if ok:
+        print(f"OK: within budget of {budget:.3f}s")
+    return ok, result
@@ -0,0 +1,176 @@
+import json
+import numpy as np
+
+def _log_events(logs):
+    """(log_id, category, name, start, end) for events held in memory on the logs themselves."""
+    for i, log in enumerate(logs):
+        for event in log.get('events') or ():
+            yield (log.get('log_id', i), *event)
+
+def work_intervals(logs, events=None):
+    """Return (track_ids, starts, ends, tracks) for every unit of work in the logs.
+
+    Traced images are used for logs that have events, otherwise whole chunks.
+    `events` is an iterable of (log_id, category, name, start, end), e.g. streamed
+    by benchmark.iter_events; by default the events stored on the logs are used.
+    Tracks are the (pid, tid) pairs that did the work; track_ids index into them.
+    """
+    tracks = {}
+    track_of = {}
+    for i, log in enumerate(logs):
+        track_of[log.get('log_id', i)] = tracks.setdefault((log['pid'], log['tid']), len(tracks))
+
+    track_ids, starts, ends = [], [], []
+    traced = set()
+    for log_id, category, _, start, end in _log_events(logs) if events is None else events:
+        if log_id not in track_of:
+            continue
+        traced.add(log_id)
+        if category == 'image':
+            track_ids.append(track_of[log_id])
+            starts.append(start)
+            ends.append(end)
+
+    for i, log in enumerate(logs):
+        log_id = log.get('log_id', i)
+        if log_id not in traced:
+            track_ids.append(track_of[log_id])
+            starts.append(log['start_time'])
+            ends.append(log['end_time'])
+    return (np.asarray(track_ids, dtype=np.int64), np.asarray(starts, dtype=np.float64),
+            np.asarray(ends, dtype=np.float64), list(tracks))
+
+def concurrency_profile(starts, ends):
+    """Exact number of active intervals over time via a sweep over sorted start/end events.
+
+    Returns step-function breakpoints (times, levels), where levels[i] holds from
+    times[i] until times[i + 1], plus the peak, the time-weighted average and the
+    time spent at each concurrency level. Runs in O(n log n).
+    Zero-length intervals are dropped: they add no busy time, and with ends ordered
+    before starts their -1 would be applied before their +1.
+    """
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+    if not len(starts):
+        return {'times': np.empty(0), 'levels': np.empty(0, dtype=np.int64),
+                'max': 0, 'average': 0.0, 'time_at_level': {}}
+
+    times = np.concatenate([starts, ends])
+    deltas = np.concatenate([np.ones(len(starts), dtype=np.int64), -np.ones(len(ends), dtype=np.int64)])
+    # Ends sort before starts at equal timestamps so back-to-back work does not overlap
+    order = np.lexsort((deltas, times))
+    times = times[order]
+    levels = np.cumsum(deltas[order])
+
+    durations = np.diff(times)
+    span = times[-1] - times[0]
+    time_at_level = np.bincount(levels[:-1], weights=durations)
+    return {
+        'times': times,
+        'levels': levels,
+        'max': int(levels.max()),
+        'average': float(np.dot(levels[:-1], durations) / span) if span > 0 else 0.0,
+        'time_at_level': {level: float(t) for level, t in enumerate(time_at_level) if t > 0},
+    }
+
+def idle_breakdown(track_ids, starts, ends, num_workers):
+    """Split worker capacity (workers x wall time) into busy time and where the idle time went.
+
+    startup: before a worker's first task; gaps: between its tasks;
+    tail: after its last task while stragglers finish; unused: workers that never ran.
+    """
+    span_start, span_end = starts.min(), ends.max()
+    span = span_end - span_start
+
+    order = np.lexsort((starts, track_ids))
+    track_ids, starts, ends = track_ids[order], starts[order], ends[order]
+    new_track = np.concatenate([[True], track_ids[1:] != track_ids[:-1]])
+    rank = np.cumsum(new_track) - 1
+    num_tracks = int(rank[-1]) + 1
+
+    # Running max of end times within each track: offset every track past the previous one
+    offset = rank * (2 * span + 1)
+    covered = np.maximum.accumulate(ends - span_start + offset) - offset + span_start
+
+    first = np.flatnonzero(new_track)
+    last = np.concatenate([first[1:] - 1, [len(starts) - 1]])
+    startup = float(np.sum(starts[first] - span_start))
+    tail = float(np.sum(span_end - covered[last]))
+    gaps = float(np.sum(np.maximum(starts[1:] - covered[:-1], 0)[~new_track[1:]]))
+    unused = max(num_workers - num_tracks, 0) * span
+    capacity = max(num_workers, num_tracks) * span
+    busy = num_tracks * span - startup - gaps - tail
+
+    breakdown = {'span': span, 'capacity': capacity, 'busy': busy,
+                 'startup': startup, 'gaps': gaps, 'tail': tail, 'unused': unused}
+    breakdown['fractions'] = {k: v / capacity if capacity else 0.0
+                              for k, v in breakdown.items() if k not in ('span', 'capacity')}
+    return breakdown
+
+def print_idle_breakdown(logs, num_workers, method_name="Multiprocessing", events=None):
+    """Print concurrency and idle-time statistics for one run."""
+    track_ids, starts, ends, _ = work_intervals(logs, events)
+    if not len(starts):
+        print(f"No logs available for {method_name} idle-time breakdown")
+        return
+    profile = concurrency_profile(starts, ends)
+    breakdown = idle_breakdown(track_ids, starts, ends, num_workers)
+    fractions = breakdown['fractions']
+    print(f"\n=== {method_name}: Concurrency and Idle Time ===")
+    print(f"Wall time: {breakdown['span']:.4f}s, Max concurrent: {profile['max']}, Average concurrent: {profile['average']:.2f}")
+    for key in ('busy', 'startup', 'gaps', 'tail', 'unused'):
+        print(f"  {key.capitalize():<8} {breakdown[key]:10.4f} worker-s  ({fractions[key] * 100:5.1f}%)")
+
+def write_chrome_trace(logs, filename, method_name="Multiprocessing", events=None):
+    """Export chunk, image and stage events in Chrome trace-event JSON (open in Perfetto or chrome://tracing).
+
+    Every process and thread gets its own track. Events are read from `events`
+    (e.g. benchmark.iter_events) and written one at a time, so only the chunk
+    logs are held in memory; by default the events stored on the logs are used.
+    """
+    if not logs:
+        print(f"No logs available for {method_name} trace export")
+        return
+
+    t0 = min(log['start_time'] for log in logs)
+    thread_ids = {}
+    named_pids = set()
+    # log_id -> (pid, track number) for placing streamed events
+    placement = {}
+
+    def emit(event):
+        nonlocal first
+        f.write(("" if first else ",\n") + json.dumps(event, separators=(',', ':')))
+        first = False
+
+    def span(name, category, start, end, pid, tid, args=None):
+        event = {'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': tid,
+                 'ts': round((start - t0) * 1e6, 3), 'dur': round((end - start) * 1e6, 3)}
+        if args:
+            event['args'] = args
+        emit(event)
+
+    with open(filename, 'w') as f:
+        first = True
+        f.write('{"displayTimeUnit":"ms","traceEvents":[\n')
+        for i, log in enumerate(logs):
+            pid = log['pid']
+            key = (pid, log['tid'])
+            if key not in thread_ids:
+                # Thread idents are large opaque integers; give each thread a compact track number
+                thread_ids[key] = len(thread_ids)
+                if pid not in named_pids:
+                    named_pids.add(pid)
+                    emit({'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': f"{method_name} PID {pid}"}})
+                emit({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_ids[key],
+                      'args': {'name': f"Thread {log['tid']}"}})
+            tid = thread_ids[key]
+            placement[log.get('log_id', i)] = (pid, tid)
+            workers = log.get('total_process', log.get('total_workers'))
+            span(f"Chunk {log['chunk_id']}", 'chunk', log['start_time'], log['end_time'], pid, tid,
+                 {'core_id': log.get('core_id'), 'workers': workers})
+        for log_id, category, name, start, end in _log_events(logs) if events is None else events:
+            if log_id in placement:
+                span(name, category, start, end, *placement[log_id])
+        f.write('\n]}\n')
+    print(f"Chrome trace saved as {filename} (open in https://ui.perfetto.dev)")
@@ -0,0 +1,131 @@
+import os
+import time
+import shutil
+import hashlib
+import tempfile
+
+PARTIAL_BYTES = 64 * 1024
+
+def _file_hash(path, limit=None):
+    """BLAKE2b digest of the first `limit` bytes of a file, or of the whole file."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        if limit is not None:
+            h.update(f.read(limit))
+        else:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+    return h.digest()
+
+def _full_hash(path):
+    # Files no larger than the partial read were already hashed in full
+    return _file_hash(path) if os.path.getsize(path) > PARTIAL_BYTES else None
+
+def _split_groups(groups, key):
+    """Split every group with more than one member by key(path); unreadable files stay alone."""
+    result = []
+    for group in groups:
+        if len(group) < 2:
+            result.append(group)
+            continue
+        buckets = {}
+        for path in group:
+            try:
+                k = key(path)
+            except OSError:
+                k = ('unreadable', path)
+            buckets.setdefault(k, []).append(path)
+        result.extend(buckets.values())
+    return result
+
+def find_duplicate_groups(paths):
+    """Group byte-identical files, cheapest check first: size, then the first 64 KiB, then the full content.
+
+    Only files that still collide are read further, so unique files cost a stat
+    call and at most one 64 KiB read. Groups keep the input order and the
+    first path of each group is its representative.
+    """
+    order = {path: i for i, path in enumerate(paths)}
+    groups = _split_groups([list(paths)], os.path.getsize)
+    groups = _split_groups(groups, lambda path: _file_hash(path, PARTIAL_BYTES))
+    groups = _split_groups(groups, _full_hash)
+    return sorted(groups, key=lambda group: order[group[0]])
+
+def dedup_images(paths):
+    """Keep one representative per group of identical images and report the work eliminated.
+
+    Returns (representatives, duplicates, stats) where duplicates maps each
+    representative to the other paths with the same content.
+    """
+    start_time = time.time()
+    groups = find_duplicate_groups(paths)
+    representatives = [group[0] for group in groups]
+    duplicates = {group[0]: group[1:] for group in groups if len(group) > 1}
+
+    eliminated = len(paths) - len(representatives)
+    stats = {
+        'inputs': len(paths),
+        'unique': len(representatives),
+        'eliminated': eliminated,
+        'eliminated_fraction': eliminated / len(paths) if paths else 0.0,
+        'bytes_skipped': sum(os.path.getsize(path) for dups in duplicates.values() for path in dups),
+        'duration': time.time() - start_time,
+    }
+
+    print("\n=== Duplicate Detection ===")
+    print(f"Inputs: {stats['inputs']}, Unique: {stats['unique']}, "
+          f"Duplicates skipped: {eliminated} ({stats['eliminated_fraction'] * 100:.1f}%)")
+    print(f"Skipped {stats['bytes_skipped'] / 1e6:.1f} MB of decoding and filtering; detection took {stats['duration']:.4f}s")
+    return representatives, duplicates, stats
+
+def filesystem_time(directory):
+    """Current time in ns on the clock the filesystem uses for mtimes in directory."""
+    os.makedirs(directory, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=directory)
+    try:
+        return os.fstat(fd).st_mtime_ns
+    finally:
+        os.close(fd)
+        os.remove(path)
+
+def fan_out(duplicates, output_dir, representatives, written_since=None):
+    """Give every duplicate the representative's output, by hardlink where possible and copy otherwise.
+
+    Outputs are named by file name only, so a duplicate whose name is already taken
+    by another input's output is skipped rather than overwriting that result.
+    With written_since (from filesystem_time before processing), only outputs
+    written after it are shared, never a stale one from an earlier run.
+    Returns (linked, copied, skipped).
+    """
+    # Output name -> the representative whose result lives there
+    owners = {os.path.basename(rep): rep for rep in representatives}
+    linked = copied = skipped = 0
+    for representative, dups in duplicates.items():
+        source = os.path.join(output_dir, os.path.basename(representative))
+        # A failed decode writes nothing, leaving either no output or an earlier run's
+        try:
+            mtime = os.stat(source).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        if written_since is not None and mtime < written_since:
+            print(f"Not sharing result of {representative}: it was not written in this run")
+            continue
+        for path in dups:
+            name = os.path.basename(path)
+            owner = owners.setdefault(name, representative)
+            if owner != representative:
+                print(f"Not sharing result with {path}: {name} is the output of {owner}")
+                skipped += 1
+                continue
+            target = os.path.join(output_dir, name)
+            if target == source:
+                continue
+            if os.path.lexists(target):
+                os.remove(target)
+            try:
+                os.link(source, target)
+                linked += 1
+            except OSError:
+                shutil.copy2(source, target)
+                copied += 1
+    return linked, copied, skipped
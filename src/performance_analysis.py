@@ -1,30 +1,47 @@
 import os
 import sys
 import time
-import zipfile
-from cv2 import log
-from tqdm import tqdm
+import argparse
 
-# Set matplotlib backend for headless environments (GCP, servers without display)
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
+# Keep module-level imports minimal: with the spawn start method every worker
+# re-imports this script, so heavy libraries are imported inside the commands.
 
 # Add src directory to path for proper imports
 sys.path.insert(0, os.path.dirname(__file__))
 
-from utils import process_image
-from analysis import analyze_data_parallelism, analyze_task_parallelism, print_detailed_comparison, save_results_to_excel, plot_comparison, plot_core_timeline, plot_thread_core_usage, plot_parallelism_over_time
-
 IMAGE_DIR = os.path.join(os.path.dirname(__file__), "../data/waffles")
 OUTPUT_BASE = os.path.join(os.path.dirname(__file__), "../output")
 
 def run_sequential(images, output_dir):
+    from utils import process_image
     start_time = time.time()
     for img_path in images:
         process_image(img_path, output_dir)
     return time.time() - start_time
 
-if __name__ == '__main__':
+def at_least(minimum):
+    """argparse type for integers >= minimum; bad values are reported through parser.error."""
+    def parse(value):
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {number}")
+        return number
+    return parse
+
+def parse_counts(value):
+    counts = sorted({at_least(1)(c) for c in value.split(',') if c.strip()})
+    if not counts:
+        raise argparse.ArgumentTypeError("expected at least one worker count")
+    return counts
+
+def collect_images():
+    """Unzip data.zip if present and return every image under data/."""
+    import zipfile
+    from tqdm import tqdm
+
     # Unzip data.zip if it exists
     zip_path = os.path.join(os.path.dirname(__file__), "../data.zip")
     if os.path.exists(zip_path):
@@ -56,7 +73,7 @@ if __name__ == '__main__':
 
     if not image_dirs:
         print("No image directories found.")
-        sys.exit(1)
+        return []
 
     # Collect all images from all directories
     all_images = []
@@ -71,10 +88,68 @@ if __name__ == '__main__':
 
     if not all_images:
         print("No images found in any directory.")
+        return []
+
+    return all_images
+
+def cmd_process(args):
+    """Run the filter pipeline once over every image."""
+    from analysis import data_parallelism_multiprocessing
+    all_images = collect_images()
+    if not all_images:
+        sys.exit(1)
+
+    # Process one copy of each identical image and share its output with the others
+    duplicates = {}
+    if not args.no_dedup:
+        from dedup import dedup_images, filesystem_time, fan_out
+        all_images, duplicates, _ = dedup_images(all_images)
+
+    output_dir = os.path.join(OUTPUT_BASE, "processed")
+    # Outputs older than this are left over from earlier runs and must not be shared
+    run_start = filesystem_time(output_dir) if duplicates else None
+    if args.workers == 1:
+        duration = run_sequential(all_images, output_dir)
+    else:
+        duration, _ = data_parallelism_multiprocessing(all_images, output_dir, args.workers, verbose=False)
+    print(f"Processed {len(all_images)} images with {args.workers} worker(s) in {duration:.4f}s -> {output_dir}")
+
+    if duplicates:
+        linked, copied, skipped = fan_out(duplicates, output_dir, all_images, written_since=run_start)
+        print(f"Shared results with duplicates: {linked} hardlinked, {copied} copied, {skipped} skipped (name taken)")
+
+def cmd_benchmark(args):
+    """Run the single-shot analysis, the scaling study or the worker startup check."""
+    if args.startup:
+        from analysis import check_worker_startup
+        ok, _ = check_worker_startup(budget=args.startup_budget, trials=args.trials)
+        sys.exit(0 if ok else 1)
+
+    from analysis.scaling_study import BACKENDS
+    unknown = [b for b in args.backends if b not in BACKENDS]
+    if unknown:
+        sys.exit(f"Unknown backend(s): {', '.join(unknown)} (choose from {', '.join(BACKENDS)})")
+
+    all_images = collect_images()
+    if not all_images:
         sys.exit(1)
 
+    if args.dedup:
+        from dedup import dedup_images
+        all_images, _, _ = dedup_images(all_images)
+
+    if args.study:
+        from analysis import run_scaling_study, save_study
+        study = run_scaling_study(all_images, counts=args.workers, backends=args.backends,
+                                  trials=args.trials, warmup=args.warmup,
+                                  null_sink=not args.write_output, weak_per_worker=args.weak_per_worker)
+        save_study(study, args.study_file)
+        return
+
+    from analysis import analyze_data_parallelism, print_detailed_comparison, save_benchmark
+
     # Analyze data parallelism with both libraries (using 1-core as baseline)
-    data_mp_results, data_futures_results, logs_mp, logs_futures = analyze_data_parallelism(all_images)
+    data_mp_results, data_futures_results, logs_mp, logs_futures = analyze_data_parallelism(all_images, args.workers, trace=args.trace)
     # data_mp_results, logs_mp = analyze_data_parallelism(all_images, seq_time)
 
     # Analyze task parallelism with both libraries
@@ -83,20 +158,97 @@ if __name__ == '__main__':
     # Print detailed comparison
     print_detailed_comparison(data_mp_results, data_futures_results)
 
+    save_benchmark(data_mp_results, data_futures_results, logs_mp, logs_futures, filename=args.results)
+
+    if args.report:
+        cmd_report(args)
+
+def cmd_report(args):
+    """Generate the Excel workbook and charts from saved benchmark results."""
+    from analysis import load_benchmark, iter_events, save_results_to_excel, plot_comparison, plot_parallelism_over_time, print_idle_breakdown, write_chrome_trace
+
+    results = load_benchmark(args.results)
+    data_mp_results, data_futures_results = results['data_mp'], results['data_futures']
+    logs_mp, logs_futures = results['logs_mp'], results['logs_futures']
+
+    # Trace events are streamed from their own file on every pass rather than loaded up front
+    events_file = results.get('events_file')
+    def events(method):
+        return iter_events(events_file, method) if events_file else None
+
     # Save results to Excel
     save_results_to_excel(data_mp_results, data_futures_results, logs_mp=logs_mp, logs_futures=logs_futures)
 
     # Generate comparison plots
     plot_comparison(data_mp_results, data_futures_results)
-    
-    # Generate parallelism visualizations (for 8 workers)
+
+    # Generate parallelism visualizations (for the largest worker count)
     print("\n=== Generating Parallelism Visualizations ===")
-    
-    # Filter logs for 8-worker runs
-    logs_mp_8_workers = [log for log in logs_mp if log.get('chunk_id', -1) < 8]
-    logs_mt_8_workers = [log for log in logs_futures if log.get('chunk_id', -1) < 8]
-    
-    if logs_mp_8_workers:
-        plot_parallelism_over_time(logs_mp_8_workers, 8, "Multiprocessing (8 Workers)")
-    if logs_mt_8_workers:
-        plot_parallelism_over_time(logs_mt_8_workers, 8, "Multithreading (8 Workers)")
\ No newline at end of file
+    max_workers = max(count for count, _, _, _ in data_mp_results)
+
+    # Filter logs for the largest runs
+    logs_mp_max = [log for log in logs_mp if log.get('total_process') == max_workers]
+    logs_mt_max = [log for log in logs_futures if log.get('total_workers') == max_workers]
+
+    if logs_mp_max:
+        plot_parallelism_over_time(logs_mp_max, max_workers, f"Multiprocessing ({max_workers} Workers)", events('mp'))
+        print_idle_breakdown(logs_mp_max, max_workers, f"Multiprocessing ({max_workers} Workers)", events('mp'))
+    if logs_mt_max:
+        plot_parallelism_over_time(logs_mt_max, max_workers, f"Multithreading ({max_workers} Workers)", events('futures'))
+        print_idle_breakdown(logs_mt_max, max_workers, f"Multithreading ({max_workers} Workers)", events('futures'))
+
+    # Export every run as a Chrome trace for inspection in Perfetto
+    write_chrome_trace(logs_mp, "trace_multiprocessing.json", "Multiprocessing", events('mp'))
+    write_chrome_trace(logs_futures, "trace_multithreading.json", "Multithreading", events('futures'))
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Parallel image processing performance analysis")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    process = subparsers.add_parser('process', help="filter every image under data/ into output/processed")
+    process.add_argument('--workers', type=at_least(1), default=os.cpu_count(),
+                         help="number of worker processes (default: all cores)")
+    process.add_argument('--no-dedup', action='store_true',
+                         help="process byte-identical images separately instead of once")
+    process.set_defaults(func=cmd_process)
+
+    benchmark = subparsers.add_parser('benchmark', help="measure parallel performance")
+    benchmark.add_argument('--workers', type=parse_counts, default=[1, 2, 4, 8],
+                           help="comma-separated worker counts (default: 1,2,4,8)")
+    benchmark.add_argument('--results', default="benchmark_results.json",
+                           help="where to save the single-shot results for the report command")
+    benchmark.add_argument('--dedup', action='store_true',
+                           help="drop byte-identical images before benchmarking")
+    benchmark.add_argument('--report', action='store_true', help="generate the report right after benchmarking")
+    benchmark.add_argument('--trace', action='store_true',
+                           help="record per-image and per-stage events for the Chrome trace export")
+    benchmark.add_argument('--study', action='store_true',
+                           help="run the repeated-trial scaling study instead of the single-shot analysis")
+    benchmark.add_argument('--backends', type=lambda v: v.split(','), default=['mp', 'mt'],
+                           help="comma-separated study backends: mp, mt, task_mp, task_futures (default: mp,mt)")
+    benchmark.add_argument('--trials', type=at_least(1), default=5, help="timed trials per configuration (default: 5)")
+    benchmark.add_argument('--warmup', type=at_least(0), default=1, help="untimed warm-up runs per configuration (default: 1)")
+    benchmark.add_argument('--write-output', action='store_true',
+                           help="write filtered images during the study (default: null sink, compute only)")
+    benchmark.add_argument('--weak-per-worker', type=at_least(1), default=None,
+                           help="also run weak scaling with this many images per worker")
+    benchmark.add_argument('--study-file', default="scaling_study.json", help="where to save the study results")
+    benchmark.add_argument('--startup', action='store_true',
+                           help="check worker startup time and imports instead; exits non-zero on regression")
+    benchmark.add_argument('--startup-budget', type=float, default=1.0,
+                           help="maximum median worker startup time in seconds (default: 1.0)")
+    benchmark.set_defaults(func=cmd_benchmark)
+
+    report = subparsers.add_parser('report', help="build the Excel workbook and charts from saved results")
+    report.add_argument('--results', default="benchmark_results.json", help="benchmark results to report on")
+    report.set_defaults(func=cmd_report)
+
+    args = parser.parse_args()
+    # The single-shot analysis measures speedup against its own 1-worker run
+    if args.command == 'benchmark' and not args.study and not args.startup and 1 not in args.workers:
+        benchmark.error("--workers must include 1 (the speedup baseline) unless --study is used")
+    return args
+
+if __name__ == '__main__':
+    args = parse_args()
+    args.func(args)
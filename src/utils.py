@@ -1,5 +1,7 @@
 import cv2
 import os
+import time
+import threading
 from filters import (
     grayscale,
     gaussian_blur,
@@ -8,21 +10,51 @@ from filters import (
     adjust_brightness
 )
 
-def process_image(image_path, output_dir):
-    """Apply full image processing pipeline to one image"""
+PIPELINE = (
+    ('grayscale', grayscale),
+    ('gaussian_blur', gaussian_blur),
+    ('sobel_edge', sobel_edge),
+    ('sharpen', sharpen),
+    ('adjust_brightness', adjust_brightness),
+)
+
+def process_image(image_path, output_dir, events=None):
+    """Apply full image processing pipeline to one image (output_dir=None discards the result).
+
+    If an events list is given, (category, name, start_time, end_time) tuples are
+    appended for the whole image and for each pipeline stage.
+    """
+    image_start = time.time()
     img = cv2.imread(image_path)
+    if events is not None:
+        events.append(('stage', 'read', image_start, time.time()))
 
     if img is None:
+        # Still record the image so failed decodes count as work in the concurrency analysis
+        if events is not None:
+            events.append(('image', os.path.basename(image_path), image_start, time.time()))
         return
 
-    img = grayscale(img)
-    img = gaussian_blur(img)
-    img = sobel_edge(img)
-    img = sharpen(img)
-    img = adjust_brightness(img)
+    for name, stage in PIPELINE:
+        stage_start = time.time()
+        img = stage(img)
+        if events is not None:
+            events.append(('stage', name, stage_start, time.time()))
+
+    if output_dir is not None:
+        write_start = time.time()
+        os.makedirs(output_dir, exist_ok=True)
+        filename = os.path.basename(image_path)
+        output_path = os.path.join(output_dir, filename)
 
-    os.makedirs(output_dir, exist_ok=True)
-    filename = os.path.basename(image_path)
-    output_path = os.path.join(output_dir, filename)
+        # Write beside the target and swap it in, so an output hardlinked to other
+        # names (see dedup.fan_out) gets a new inode instead of rewriting theirs
+        root, ext = os.path.splitext(output_path)
+        tmp_path = f"{root}.{os.getpid()}.{threading.get_ident()}.tmp{ext}"
+        if cv2.imwrite(tmp_path, img):
+            os.replace(tmp_path, output_path)
+        if events is not None:
+            events.append(('stage', 'write', write_start, time.time()))
 
-    cv2.imwrite(output_path, img)
+    if events is not None:
+        events.append(('image', os.path.basename(image_path), image_start, time.time()))
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+import numpy as np
+import cv2
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../src"))
+
+import dedup
+from dedup import PARTIAL_BYTES, find_duplicate_groups, fan_out, filesystem_time
+from utils import process_image
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return str(path)
+
+def write_image(path, seed):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    img = np.random.default_rng(seed).integers(0, 255, (32, 32, 3), dtype=np.uint8)
+    cv2.imwrite(str(path), img)
+    return str(path)
+
+def test_same_size_different_content_past_partial_hash(tmp_path):
+    head = os.urandom(PARTIAL_BYTES)
+    a = write(tmp_path / "a.jpg", head + b"tail-one")
+    b = write(tmp_path / "b.jpg", head + b"tail-two")
+    c = write(tmp_path / "c.jpg", head + b"tail-one")
+    assert find_duplicate_groups([a, b, c]) == [[a, c], [b]]
+
+def test_identical_small_files_are_grouped(tmp_path):
+    a = write(tmp_path / "x" / "a.jpg", b"small")
+    b = write(tmp_path / "y" / "b.jpg", b"small")
+    assert os.path.getsize(a) <= PARTIAL_BYTES
+    assert find_duplicate_groups([a, b]) == [[a, b]]
+
+def test_unreadable_files_stay_in_their_own_group(tmp_path, monkeypatch):
+    a = write(tmp_path / "a.jpg", b"same")
+    b = write(tmp_path / "b.jpg", b"same")
+    missing = str(tmp_path / "missing.jpg")
+    assert find_duplicate_groups([a, missing, b]) == [[a, b], [missing]]
+
+    real_hash = dedup._file_hash
+    def failing_hash(path, limit=None):
+        if path == b:
+            raise PermissionError(path)
+        return real_hash(path, limit)
+    monkeypatch.setattr(dedup, "_file_hash", failing_hash)
+    assert find_duplicate_groups([a, b]) == [[a], [b]]
+
+def test_fan_out_does_not_overwrite_another_inputs_output(tmp_path):
+    out = tmp_path / "out"
+    rep = write(tmp_path / "a" / "img.jpg", b"shared")
+    dup = write(tmp_path / "b" / "y.jpg", b"shared")
+    other = write(tmp_path / "c" / "y.jpg", b"unrelated")
+    write(out / "img.jpg", b"result of img")
+    write(out / "y.jpg", b"result of c/y")
+
+    linked, copied, skipped = fan_out({rep: [dup]}, str(out), [rep, other])
+    assert (linked, copied, skipped) == (0, 0, 1)
+    assert (out / "y.jpg").read_bytes() == b"result of c/y"
+
+def test_fan_out_skips_outputs_from_earlier_runs(tmp_path):
+    out = tmp_path / "out"
+    rep = write(tmp_path / "a" / "img.jpg", b"shared")
+    dup = write(tmp_path / "b" / "copy.jpg", b"shared")
+    write(out / "img.jpg", b"stale result")
+    old = time.time() - 60
+    os.utime(out / "img.jpg", (old, old))
+
+    run_start = filesystem_time(str(out))
+    assert fan_out({rep: [dup]}, str(out), [rep], written_since=run_start) == (0, 0, 0)
+    assert not (out / "copy.jpg").exists()
+
+def test_rewriting_a_linked_output_leaves_the_other_names_unchanged(tmp_path):
+    out = str(tmp_path / "out")
+    rep = write_image(tmp_path / "a" / "img.png", seed=0)
+    dup = write_image(tmp_path / "b" / "copy.png", seed=0)
+
+    run_start = filesystem_time(out)
+    process_image(rep, out)
+    assert fan_out({rep: [dup]}, out, [rep], written_since=run_start) == (1, 0, 0)
+    assert os.path.samefile(os.path.join(out, "img.png"), os.path.join(out, "copy.png"))
+
+    shared = (tmp_path / "out" / "img.png").read_bytes()
+    write_image(tmp_path / "b" / "copy.png", seed=1)
+    process_image(dup, out)
+    assert (tmp_path / "out" / "img.png").read_bytes() == shared
+    assert (tmp_path / "out" / "copy.png").read_bytes() != shared
@@ -0,0 +1,58 @@
+import os
+import sys
+import json
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../src"))
+
+from analysis.scaling_study import summarize_speedup, fit_amdahl, fit_gustafson
+
+COUNTS = [1, 2, 4, 8, 16]
+
+def test_amdahl_recovers_serial_fraction():
+    serial = 0.15
+    speedups = [1 / (serial + (1 - serial) / p) for p in COUNTS]
+    fit = fit_amdahl(COUNTS, speedups)
+    assert fit['serial_fraction'] == pytest.approx(serial)
+    assert fit['max_speedup'] == pytest.approx(1 / serial)
+    assert fit['predicted'] == pytest.approx(speedups)
+
+def test_gustafson_recovers_serial_fraction():
+    serial = 0.2
+    speedups = [p - serial * (p - 1) for p in COUNTS]
+    fit = fit_gustafson(COUNTS, speedups)
+    assert fit['serial_fraction'] == pytest.approx(serial)
+    assert fit['predicted'] == pytest.approx(speedups)
+
+def test_superlinear_speedup_clamps_to_zero_and_stays_valid_json():
+    fit = fit_amdahl(COUNTS, [1.2 * p for p in COUNTS])
+    assert fit['serial_fraction'] == 0.0
+    assert fit['max_speedup'] is None
+    json.loads(json.dumps(fit, allow_nan=False))
+
+    fit = fit_gustafson(COUNTS, [1.2 * p for p in COUNTS])
+    assert fit['serial_fraction'] == 0.0
+
+def test_fits_need_more_than_one_worker():
+    assert fit_amdahl([1], [1.0]) is None
+    assert fit_gustafson([1], [1.0]) is None
+
+def test_speedup_interval_matches_delta_method_by_hand():
+    # Baseline: mean 4.0, stdev 0.2; parallel: mean 1.0, stdev 0.05; n = 3 each.
+    # Relative variance 0.05**2 / 3 + 0.05**2 / 3, so stderr = 4 * sqrt(0.0025 * 2 / 3) = 0.163299,
+    # and the half-width uses t(df=2) = 4.303: 4.303 * 0.163299 = 0.702677.
+    result = summarize_speedup([4.0, 4.2, 3.8], [1.0, 1.05, 0.95])
+    assert result['mean'] == pytest.approx(4.0)
+    assert result['stderr'] == pytest.approx(0.163299, abs=1e-6)
+    assert result['ci95_low'] == pytest.approx(3.297323, abs=1e-6)
+    assert result['ci95_high'] == pytest.approx(4.702677, abs=1e-6)
+
+def test_speedup_interval_includes_baseline_variance():
+    exact_baseline = summarize_speedup([4.0, 4.0, 4.0], [1.0, 1.05, 0.95])
+    noisy_baseline = summarize_speedup([4.0, 4.2, 3.8], [1.0, 1.05, 0.95])
+    assert noisy_baseline['stderr'] > exact_baseline['stderr']
+
+def test_speedup_scale_for_weak_scaling():
+    result = summarize_speedup([2.0, 2.0], [1.0, 1.0], scale=4)
+    assert result['mean'] == pytest.approx(8.0)
+    assert result['ci95_low'] == result['ci95_high'] == pytest.approx(8.0)
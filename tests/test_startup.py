@@ -0,0 +1,12 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../src"))
+
+from analysis.startup import measure_worker_startup
+
+def test_worker_startup_does_not_import_reporting_libraries():
+    # Fails if performance_analysis.py or the worker modules import pandas,
+    # matplotlib, tqdm or openpyxl at module level
+    result = measure_worker_startup(trials=1)
+    assert result['heavy_modules'] == []
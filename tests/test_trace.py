@@ -0,0 +1,99 @@
+import os
+import sys
+import json
+import random
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../src"))
+
+from analysis.trace import concurrency_profile, idle_breakdown, work_intervals, write_chrome_trace
+from analysis.benchmark import save_benchmark, load_benchmark, iter_events
+
+def brute_force_levels(starts, ends, times):
+    """Active count just after each time point, with half-open [start, end) intervals."""
+    return [sum(1 for s, e in zip(starts, ends) if s <= t < e) for t in times]
+
+def test_sweep_matches_brute_force():
+    rng = random.Random(0)
+    starts = np.array([rng.uniform(0, 10) for _ in range(200)])
+    ends = starts + np.array([rng.uniform(0.01, 2) for _ in range(200)])
+    profile = concurrency_profile(starts, ends)
+
+    times = profile['times'][:-1]
+    expected = brute_force_levels(starts, ends, times)
+    assert list(profile['levels'][:-1]) == expected
+    durations = np.diff(profile['times'])
+    assert profile['average'] == pytest.approx(np.dot(expected, durations) / (ends.max() - starts.min()))
+    assert profile['max'] == max(expected)
+
+def test_back_to_back_intervals_do_not_overlap():
+    profile = concurrency_profile(np.array([0.0, 1.0]), np.array([1.0, 2.0]))
+    assert profile['max'] == 1
+    assert profile['average'] == pytest.approx(1.0)
+
+def test_zero_length_interval_alone():
+    profile = concurrency_profile(np.array([0.0, 2.0]), np.array([1.0, 2.0]))
+    assert profile['levels'].min() >= 0
+    assert profile['time_at_level'] == {1: pytest.approx(1.0)}
+
+def test_zero_length_interval_inside_other_work():
+    profile = concurrency_profile(np.array([0.0, 0.5]), np.array([1.0, 0.5]))
+    assert list(profile['levels']) == [1, 0]
+    assert profile['average'] == pytest.approx(1.0)
+
+def test_empty_input():
+    profile = concurrency_profile(np.array([]), np.array([]))
+    assert profile['max'] == 0
+    assert profile['average'] == 0.0
+    assert len(profile['times']) == 0
+
+def test_idle_breakdown_accounts_for_all_capacity():
+    track_ids = np.array([0, 0, 1])
+    starts = np.array([0.0, 2.0, 1.0])
+    ends = np.array([1.0, 3.0, 2.0])
+    breakdown = idle_breakdown(track_ids, starts, ends, num_workers=3)
+
+    assert breakdown['busy'] == pytest.approx(3.0)
+    assert breakdown['startup'] == pytest.approx(1.0)
+    assert breakdown['gaps'] == pytest.approx(1.0)
+    assert breakdown['tail'] == pytest.approx(1.0)
+    assert breakdown['unused'] == pytest.approx(3.0)
+    parts = sum(breakdown[k] for k in ('busy', 'startup', 'gaps', 'tail', 'unused'))
+    assert parts == pytest.approx(breakdown['capacity'])
+
+def traced_logs():
+    logs = []
+    for chunk_id in range(3):
+        start = 10.0 + chunk_id
+        events = [('stage', 'read', start, start + 0.1), ('image', f'{chunk_id}.jpg', start, start + 0.5)]
+        logs.append({'chunk_id': chunk_id, 'core_id': chunk_id, 'pid': 100, 'tid': chunk_id,
+                     'start_time': start, 'end_time': start + 0.6, 'total_process': 3, 'events': events})
+    # A chunk with no events falls back to its own interval
+    logs.append({'chunk_id': 3, 'core_id': 3, 'pid': 101, 'tid': 7,
+                 'start_time': 11.0, 'end_time': 11.2, 'total_process': 3, 'events': []})
+    return logs
+
+def test_saved_events_are_streamed_back_like_in_memory_events(tmp_path):
+    logs = traced_logs()
+    results_file = str(tmp_path / "results.json")
+    save_benchmark([(1, 1.0, 1.0, 1.0)], [(1, 1.0, 1.0, 1.0)], logs, [], filename=results_file)
+
+    results = load_benchmark(results_file)
+    assert all('events' not in log for log in results['logs_mp'])
+    assert sum(1 for _ in iter_events(results['events_file'], 'mp')) == 6
+    assert list(iter_events(results['events_file'], 'futures')) == []
+
+    # Filtering the loaded logs keeps events matched to the right chunk
+    subset = results['logs_mp'][1:]
+    streamed = work_intervals(subset, iter_events(results['events_file'], 'mp'))
+    in_memory = work_intervals(logs[1:])
+    for a, b in zip(streamed[:3], in_memory[:3]):
+        assert list(a) == list(b)
+
+    streamed_trace, in_memory_trace = tmp_path / "streamed.json", tmp_path / "memory.json"
+    write_chrome_trace(results['logs_mp'], str(streamed_trace), events=iter_events(results['events_file'], 'mp'))
+    write_chrome_trace(logs, str(in_memory_trace))
+    key = lambda e: json.dumps(e, sort_keys=True)
+    assert sorted(map(key, json.loads(streamed_trace.read_text())['traceEvents'])) == \
+        sorted(map(key, json.loads(in_memory_trace.read_text())['traceEvents']))